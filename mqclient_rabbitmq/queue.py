@@ -7,15 +7,14 @@ import mqclient
 
 from . import rabbitmq
 
+# resolve once at import, not on every Queue construction
+_BACKEND = cast(  # mypy is very picky
+    mqclient.backend_interface.Backend, rabbitmq.Backend
+)
+
 
 class Queue(mqclient.queue.Queue):
     __doc__ = mqclient.queue.Queue.__doc__
 
     def __init__(self, *args: Any, **kargs: Any) -> None:
-        super().__init__(
-            cast(  # mypy is very picky
-                mqclient.backend_interface.Backend, rabbitmq.Backend
-            ),
-            *args,
-            **kargs
-        )
+        super().__init__(_BACKEND, *args, **kargs)
@@ -1,9 +1,25 @@
 """Back-end using RabbitMQ."""
 
+import asyncio
 import logging
+import math
+import threading
 import time
-from functools import partial
-from typing import Any, AsyncGenerator, Callable, Optional, Union
+import weakref
+from collections import deque
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pika  # type: ignore
 from mqclient import backend_interface, log_msgs
@@ -23,21 +39,82 @@ from mqclient.backend_interface import (
 LOGGER = logging.getLogger("mqclient-rabbitmq")
 
 AMQP_ADDRESS_PREFIX = "amqp://"
+AMQPS_ADDRESS_PREFIX = "amqps://"
+
+AUTO_PREFETCH_MAX = 256
+EWMA_ALPHA = 0.2  # weight of the newest sample
+# `get_message()` polls with a backoff: 0, then doubling from min up to max
+GETMSG_POLL_INTERVAL_MIN = 0.001  # seconds
+GETMSG_POLL_INTERVAL = 0.01  # seconds
+
+# live pubs, shared by `Backend.create_pub_queue()` within a thread (along
+# with their connection) -- keyed by (address, name, thread id)
+_PUB_POOL: Dict[Tuple[str, str, int], "RabbitMQPub"] = {}
+
+# live connections, shared by queues of the same role (pub/sub) & address,
+# within a thread (pika connections aren't thread-safe) -- keyed by
+# (role, address, thread id), values are (connection, number of queues using it)
+_CONNECTIONS: Dict[Tuple[str, str, int], Tuple[pika.BlockingConnection, int]] = {}
+
+# queues already declared on each (live) connection -- e.g., by another sub
+# of the same queue sharing it (pubs & subs never share a connection)
+_DECLARED: "weakref.WeakKeyDictionary[pika.BlockingConnection, Set[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _amqp_address(address: str) -> str:
+    """Return `address` with an AMQP scheme, prefixing `amqp://` if needed."""
+    if address.startswith((AMQP_ADDRESS_PREFIX, AMQPS_ADDRESS_PREFIX)):
+        return address
+    return AMQP_ADDRESS_PREFIX + address
+
+
+def _acquire_connection(
+    key: Tuple[str, str, int], params: pika.connection.URLParameters
+) -> pika.BlockingConnection:
+    """Return the live connection for `key`, opening one if needed."""
+    connection, refs = _CONNECTIONS.get(key, (None, 0))
+    if not connection or not connection.is_open:
+        connection, refs = pika.BlockingConnection(params), 0
+    _CONNECTIONS[key] = (connection, refs + 1)
+    return connection
+
+
+def _release_connection(
+    key: Tuple[str, str, int], connection: pika.BlockingConnection
+) -> bool:
+    """Drop a reference to `connection`; return whether it should be closed."""
+    shared, refs = _CONNECTIONS.get(key, (None, 0))
+    if shared is not connection:  # was replaced (or never shared)
+        return True
+    if refs > 1:
+        _CONNECTIONS[key] = (connection, refs - 1)
+        return False
+    del _CONNECTIONS[key]
+    return True
 
 
 class RabbitMQ(RawQueue):
     """Base RabbitMQ wrapper.
 
+    Queues of the same role with the same address share one connection,
+    each with its own channel -- but only within a thread, since pika's
+    `BlockingConnection` is not thread-safe.
+
     Extends:
         RawQueue
     """
 
+    _ROLE = ""
+
     def __init__(self, address: str, queue: str) -> None:
         super().__init__()
-        self.address = address
-        if not self.address.startswith(AMQP_ADDRESS_PREFIX):
-            self.address = AMQP_ADDRESS_PREFIX + self.address
+        self.address = _amqp_address(address)
+        # parse once, not on every (re)connect
+        self._params = pika.connection.URLParameters(self.address)
         self.queue = queue
+        self._connection_key = (self._ROLE, self.address, 0)
         self.connection: Optional[pika.BlockingConnection] = None
         self.channel: Optional[pika.adapters.blocking_connection.BlockingChannel] = None
 
@@ -45,13 +122,28 @@ class RabbitMQ(RawQueue):
         """Set up connection and channel."""
         await super().connect()
         LOGGER.info(f"Connecting with address={self.address}")
-        self.connection = pika.BlockingConnection(
-            pika.connection.URLParameters(self.address)
-        )
+        self._connection_key = (self._ROLE, self.address, threading.get_ident())
+        self.connection = _acquire_connection(self._connection_key, self._params)
         self.channel = self.connection.channel()
 
+    def _declare_queue(self) -> None:
+        """Declare the queue, unless it was already declared on this connection."""
+        if not self.channel or not self.connection:
+            raise ConnectingFailedExcpetion("No channel to configure connection.")
+
+        declared = _DECLARED.setdefault(self.connection, set())
+        if self.queue in declared:
+            return
+        self.channel.queue_declare(queue=self.queue, durable=False)
+        declared.add(self.queue)
+
+    def _close_channels(self) -> None:
+        """Close this queue's channel(s), but not the (shared) connection."""
+        if self.channel:
+            self.channel.close()
+
     async def close(self) -> None:
-        """Close connection."""
+        """Close channel, and connection if no other queue is using it."""
         await super().close()
 
         if not self.channel:
@@ -61,6 +153,15 @@ class RabbitMQ(RawQueue):
         if self.connection.is_closed:
             raise AlreadyClosedExcpetion()
 
+        if not _release_connection(self._connection_key, self.connection):
+            try:
+                self._close_channels()
+            except Exception as e:
+                raise ClosingFailedExcpetion() from e
+            return
+
+        _DECLARED.pop(self.connection, None)
+
         try:
             self.connection.close()
         except Exception as e:
@@ -78,9 +179,18 @@ class RabbitMQPub(RabbitMQ, Pub):
         Pub
     """
 
+    _ROLE = "pub"
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         LOGGER.debug(f"{log_msgs.INIT_PUB} ({args}; {kwargs})")
         super().__init__(*args, **kwargs)
+        # transactional channel for `send_message_batch()`, opened on demand
+        self._tx_channel: Optional[
+            pika.adapters.blocking_connection.BlockingChannel
+        ] = None
+        # number of `Backend.create_pub_queue()` callers sharing this pub
+        self._refs = 1
+        self._pool_key = (self.address, self.queue, threading.get_ident())
 
     async def connect(self) -> None:
         """Set up connection, channel, and queue.
@@ -93,17 +203,36 @@ class RabbitMQPub(RabbitMQ, Pub):
         if not self.channel:
             raise ConnectingFailedExcpetion("No channel to configure connection.")
 
-        self.channel.queue_declare(queue=self.queue, durable=False)
+        self._declare_queue()
         self.channel.confirm_delivery()
+        self._tx_channel = None
 
         LOGGER.debug(log_msgs.CONNECTED_PUB)
 
     async def close(self) -> None:
-        """Close connection."""
+        """Close connection.
+
+        If this pub is shared (see `Backend.create_pub_queue()`), only the
+        last `close()` actually closes the connection.
+        """
+        if self._refs > 1:
+            self._refs -= 1
+            LOGGER.debug("Pub still shared (%d references), not closing.", self._refs)
+            return
+        if _PUB_POOL.get(self._pool_key) is self:
+            del _PUB_POOL[self._pool_key]
+
         LOGGER.debug(log_msgs.CLOSING_PUB)
         await super().close()
         LOGGER.debug(log_msgs.CLOSED_PUB)
 
+    def _close_channels(self) -> None:
+        """Close the transactional channel too (also on `try_call()` retries)."""
+        if self._tx_channel and self._tx_channel.is_open:
+            self._tx_channel.close()
+        self._tx_channel = None
+        super()._close_channels()
+
     async def send_message(self, msg: bytes) -> None:
         """Send a message on a queue.
 
@@ -120,15 +249,49 @@ class RabbitMQPub(RabbitMQ, Pub):
 
         await try_call(
             self,
-            partial(
-                self.channel.basic_publish,
-                exchange="",
-                routing_key=self.queue,
-                body=msg,
-            ),
+            self.channel.basic_publish,
+            exchange="",
+            routing_key=self.queue,
+            body=msg,
         )
         LOGGER.debug(log_msgs.SENT_MESSAGE)
 
+    def _publish_batch(self, msgs: List[bytes]) -> None:
+        """Publish all of `msgs` in one transaction."""
+        if not self.connection:
+            raise RuntimeError("queue is not connected")
+
+        if not self._tx_channel or self._tx_channel.is_closed:
+            self._tx_channel = self.connection.channel()
+            self._tx_channel.tx_select()
+
+        for msg in msgs:
+            self._tx_channel.basic_publish(
+                exchange="", routing_key=self.queue, body=msg
+            )
+        self._tx_channel.tx_commit()
+
+    async def send_message_batch(self, msgs: Iterable[bytes]) -> None:
+        """Send several messages on a queue, with a single round-trip.
+
+        The messages are published back-to-back on a transactional channel,
+        then committed at once -- the commit is the only thing waited on
+        (vs. `send_message()`, which waits on a broker confirm per message).
+        If the connection fails, the whole (uncommitted) batch is retried.
+
+        NOTE - messages sent this way are not ordered w.r.t. `send_message()`.
+        """
+        LOGGER.debug(log_msgs.SENDING_MESSAGE)
+        if not self.channel:
+            raise RuntimeError("queue is not connected")
+
+        msgs = list(msgs)  # retries need to re-iterate
+        if not msgs:
+            return
+
+        await try_call(self, self._publish_batch, msgs)
+        LOGGER.debug("%s (%d messages)", log_msgs.SENT_MESSAGE, len(msgs))
+
 
 class RabbitMQSub(RabbitMQ, Sub):
     """Wrapper around queue with prefetch-queue QoS.
@@ -138,11 +301,27 @@ class RabbitMQSub(RabbitMQ, Sub):
         Sub
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    _ROLE = "sub"
+
+    def __init__(self, *args: Any, ack_batch_size: int = 1, **kwargs: Any) -> None:
         LOGGER.debug(f"{log_msgs.INIT_SUB} ({args}; {kwargs})")
         super().__init__(*args, **kwargs)
-        self.consumer_id = None
+        self._ack_batch_size = ack_batch_size
+        self.consumer_id: Optional[str] = None
+        self._generator_consuming = False  # `message_generator()`'s consumer
         self.prefetch = 1
+        self._buf: Deque[Tuple[pika.spec.Basic.Deliver, bytes]] = deque()
+        self._pending_acks: List[int] = []
+        self._pending_nacks: List[int] = []
+        # tags handed out, but not yet settled (only tracked if batching)
+        self._outstanding: Set[int] = set()
+
+        # auto-tuned prefetch (see `retune()`)
+        self.auto_prefetch = False
+        self.max_prefetch = AUTO_PREFETCH_MAX
+        self._rtt_ewma: Optional[float] = None
+        self._proc_ewma: Optional[float] = None
+        self._delivered_at: Optional[float] = None
 
     async def connect(self) -> None:
         """Set up connection, channel, and queue.
@@ -155,81 +334,355 @@ class RabbitMQSub(RabbitMQ, Sub):
         if not self.channel:
             raise ConnectingFailedExcpetion("No channel to configure connection.")
 
-        self.channel.queue_declare(queue=self.queue, durable=False)
+        self._declare_queue()
         self.channel.basic_qos(prefetch_count=self.prefetch, global_qos=True)
 
+        # delivery tags are per-channel, so start counting from scratch
+        self._pending_acks = []
+        self._pending_nacks = []
+        self._outstanding.clear()
+        self.consumer_id = None
+        self._generator_consuming = False
+        self._buf.clear()
+
         LOGGER.debug(log_msgs.CONNECTED_SUB)
 
     async def close(self) -> None:
         """Close connection.
 
         Also, channel will be canceled (rejects all pending ackable messages).
+        Any batched acks/nacks are flushed first, then `get_message()`'s
+        consumer is canceled and its buffered messages are requeued.
         """
         LOGGER.debug(log_msgs.CLOSING_SUB)
+        if self.channel and self.channel.is_open:
+            await self._flush(nack=False)
+            await self._flush(nack=True)
+            if self.consumer_id:
+                await self._stop_consumer()
         await super().close()
         LOGGER.debug(log_msgs.CLOSED_SUB)
 
     @staticmethod
     def _to_message(  # type: ignore[override]  # noqa: F821 # pylint: disable=W0221
-        method_frame: Optional[pika.spec.Basic.GetOk], body: Optional[Union[str, bytes]]
+        method_frame: Optional[pika.spec.Basic.Deliver],
+        body: Optional[Union[str, bytes]],
     ) -> Optional[Message]:
         """Transform RabbitMQ-Message to Message type."""
+        if isinstance(body, str):
+            body = body.encode()
+        return RabbitMQSub._to_message_bytes(method_frame, body)
+
+    @staticmethod
+    def _to_message_bytes(
+        method_frame: Optional[pika.spec.Basic.Deliver], body: Optional[bytes]
+    ) -> Optional[Message]:
+        """Transform RabbitMQ-Message with a `bytes` body to Message type.
+
+        Pika always delivers `bytes` bodies, so the per-message paths use
+        this directly.
+        """
         if not method_frame or body is None:
             return None
+        return Message(method_frame.delivery_tag, body)
+
+    def _on_msg(
+        self,
+        _: pika.adapters.blocking_connection.BlockingChannel,
+        method_frame: pika.spec.Basic.Deliver,
+        __: pika.spec.BasicProperties,
+        body: bytes,
+    ) -> None:
+        """Buffer a message pushed by the broker (for `get_message()`)."""
+        self._buf.append((method_frame, body))
+
+    def _fill_buffer(self, time_limit: float = 0) -> None:
+        """Start the buffering consumer if needed, then process deliveries.
+
+        With the default `time_limit=0`, this does not block on the socket.
+        """
+        if not self.channel or not self.connection:
+            raise RuntimeError("queue is not connected")
 
-        if isinstance(body, str):
-            return Message(method_frame.delivery_tag, body.encode())
+        if not self.consumer_id:
+            self.consumer_id = self.channel.basic_consume(
+                self.queue, on_message_callback=self._on_msg, auto_ack=False
+            )
+        self.connection.process_data_events(time_limit=time_limit)
+
+    async def _cancel_consumer(self) -> List[int]:
+        """Cancel the buffering consumer & return the buffered delivery tags."""
+        if not self.channel:
+            raise RuntimeError("queue is not connected")
+
+        # swap out first, so a reconnect (which calls `close()`) won't re-stop
+        consumer_id, self.consumer_id = self.consumer_id, None
+        buffered = [method_frame.delivery_tag for method_frame, _ in self._buf]
+        self._buf.clear()
+
+        if consumer_id:
+            await try_call(self, self.channel.basic_cancel, consumer_id)
+        return buffered
+
+    async def _stop_consumer(self) -> None:
+        """Cancel the buffering consumer and requeue any buffered messages."""
+        if not self.channel:
+            raise RuntimeError("queue is not connected")
+
+        buffered = await self._cancel_consumer()
+        if not buffered:
+            return
+
+        # a multi-nack would also requeue any unsettled lower tag, like those
+        # already returned by `get_message()`, so only send one if there are
+        # none (the buffer holds a contiguous run of tags)
+        nothing_held = self._ack_batch_size > 1 and not (
+            self._outstanding or self._pending_acks or self._pending_nacks
+        )
+        if nothing_held and buffered[-1] == buffered[0] + len(buffered) - 1:
+            await try_call(
+                self,
+                self.channel.basic_nack,
+                buffered[-1],
+                multiple=True,
+                requeue=True,
+            )
         else:
-            return Message(method_frame.delivery_tag, body)
+            for tag in buffered:
+                await try_call(self, self.channel.basic_nack, tag, requeue=True)
 
     async def get_message(
         self, timeout_millis: Optional[int] = TIMEOUT_MILLIS_DEFAULT
     ) -> Optional[Message]:
         """Get a message from a queue.
 
-        NOTE - `timeout_millis` is not used.
+        Messages are pushed by the broker (up to `prefetch` at a time) into
+        an in-memory buffer. If the buffer is empty, wait up to
+        `timeout_millis` for a delivery -- polling (with a backoff starting
+        at 0, up to `GETMSG_POLL_INTERVAL`), so the event loop is free in
+        between.
+
+        NOTE - up to `prefetch` messages are pulled even if only one is
+        wanted (e.g., `Queue.open_sub_one()`); any still buffered are
+        requeued on `close()` (or by `message_generator()`).
         """
         LOGGER.debug(log_msgs.GETMSG_RECEIVE_MESSAGE)
         if not self.channel:
             raise RuntimeError("queue is not connected")
 
-        method_frame, _, body = await try_call(
-            self, partial(self.channel.basic_get, self.queue)
-        )
-        msg = RabbitMQSub._to_message(method_frame, body)
+        # only a wait on an empty buffer is a round-trip sample (see `retune()`)
+        fetch_start: Optional[float] = None
+        if not self._buf:
+            fetch_start = time.monotonic()
+            deadline = fetch_start + (timeout_millis or 0) / 1000
+            delay = 0.0  # the next delivery is often just a round-trip away
+            while True:
+                await try_call(self, self._fill_buffer)
+                if self._buf or time.monotonic() >= deadline:
+                    break
+                await asyncio.sleep(delay)
+                delay = min(
+                    max(2 * delay, GETMSG_POLL_INTERVAL_MIN), GETMSG_POLL_INTERVAL
+                )
+        method_frame, body = self._buf.popleft() if self._buf else (None, None)
+        msg = RabbitMQSub._to_message_bytes(method_frame, body)
 
         if msg:
-            LOGGER.debug(f"{log_msgs.GETMSG_RECEIVED_MESSAGE} ({msg.msg_id!r}).")
+            if self._ack_batch_size > 1 and method_frame:
+                self._outstanding.add(method_frame.delivery_tag)
+            if self.auto_prefetch:
+                self._record_delivery(fetch_start)
+            LOGGER.debug("%s (%r).", log_msgs.GETMSG_RECEIVED_MESSAGE, msg.msg_id)
             return msg
         else:
             LOGGER.debug(log_msgs.GETMSG_NO_MESSAGE)
             return None
 
+    def _record_delivery(self, fetch_start: Optional[float]) -> None:
+        """Update the round-trip EWMA with the time spent waiting on a message.
+
+        `fetch_start=None` means the message was already buffered locally, so
+        the (near-zero) wait says nothing about the round-trip time.
+        """
+        self._delivered_at = time.monotonic()
+        if fetch_start is not None:
+            self._rtt_ewma = _ewma(self._rtt_ewma, self._delivered_at - fetch_start)
+
+    def _record_processed(self) -> None:
+        """Update the processing-time EWMA with the time since the last delivery."""
+        if self._delivered_at is None:
+            return
+        self._proc_ewma = _ewma(self._proc_ewma, time.monotonic() - self._delivered_at)
+        self._delivered_at = None
+
+    async def retune(self) -> None:
+        """Re-size the prefetch buffer to cover the broker round-trip time.
+
+        The target is `ceil(RTT / processing_time)`, clamped to
+        `[1, max_prefetch]`, using the EWMAs collected while
+        `auto_prefetch` is on. RTT is only sampled when a message had to be
+        waited on (nothing was buffered locally), otherwise a well-sized
+        buffer would look like a zero RTT and shrink itself. The channel's
+        QoS is only updated when the target differs from the current
+        prefetch by more than 2x.
+        """
+        if not self.channel:
+            raise RuntimeError("queue is not connected")
+        if not self._rtt_ewma or not self._proc_ewma:
+            return
+
+        new = math.ceil(self._rtt_ewma / self._proc_ewma)
+        new = max(1, min(new, self.max_prefetch))
+        if max(new, self.prefetch) <= 2 * min(new, self.prefetch):
+            return
+
+        LOGGER.debug("Re-tuning prefetch (%d -> %d).", self.prefetch, new)
+        await try_call(
+            self,
+            self.channel.basic_qos,
+            prefetch_count=new,
+            global_qos=True,
+        )
+        self.prefetch = new
+
+    def _pending(self, nack: bool) -> List[int]:
+        """Return the current batch of (contiguous) tags to nack or ack."""
+        return self._pending_nacks if nack else self._pending_acks
+
+    async def _flush(self, nack: bool) -> None:
+        """Nack/ack all batched messages with a single (multi-)nack/ack frame."""
+        if not self.channel:
+            raise RuntimeError("queue is not connected")
+
+        # swap out first, so a reconnect (which calls `close()`) won't re-flush
+        pending = self._pending(nack)
+        if not pending:
+            return
+        if nack:
+            self._pending_nacks = []
+        else:
+            self._pending_acks = []
+
+        if len(pending) == 1:
+            settle = self.channel.basic_nack if nack else self.channel.basic_ack
+            await try_call(self, settle, pending[-1])
+        elif nack:
+            await try_call(
+                self, self.channel.basic_nack, pending[-1], multiple=True, requeue=True
+            )
+        else:
+            await try_call(self, self.channel.basic_ack, pending[-1], multiple=True)
+
+    async def _settle(self, msg: Message, nack: bool) -> None:
+        """Nack/ack `msg`, batching runs of contiguous delivery tags."""
+        if not self.channel:
+            raise RuntimeError("queue is not connected")
+
+        tag = msg.msg_id
+        if not isinstance(tag, int):
+            raise TypeError(f"RabbitMQ delivery tag must be an int ({tag!r})")
+
+        if self._ack_batch_size <= 1:  # no batching -> no bookkeeping
+            settle = self.channel.basic_nack if nack else self.channel.basic_ack
+            await try_call(self, settle, tag)
+            return
+
+        # settle the other kind first, so it isn't swept up by a multi-ack/nack
+        await self._flush(not nack)
+
+        # a gap in the tags ends the current batch
+        if self._pending(nack) and tag != self._pending(nack)[-1] + 1:
+            await self._flush(nack)
+
+        # a multi-ack/nack also settles every lower tag, so a batch may only
+        # start at the lowest tag still held by the caller
+        self._outstanding.discard(tag)
+        pending = self._pending(nack)
+        if pending or not self._outstanding or tag < min(self._outstanding):
+            pending.append(tag)
+            if len(pending) >= min(self._ack_batch_size, self.prefetch):
+                await self._flush(nack)
+        else:
+            settle = self.channel.basic_nack if nack else self.channel.basic_ack
+            await try_call(self, settle, tag)
+
     async def ack_message(self, msg: Message) -> None:
         """Ack a message from the queue.
 
         Note that RabbitMQ acks messages in-order, so acking message
         3 of 3 in-progress messages will ack them all.
+
+        If `ack_batch_size` > 1, acks of contiguous delivery tags are
+        accumulated and sent as one multi-ack. A batch only starts at the
+        lowest tag still held (returned by `get_message()` or
+        `message_generator()`, but not yet settled); any other message is
+        acked immediately, so a multi-ack never covers a message that is
+        still being processed.
         """
         LOGGER.debug(log_msgs.ACKING_MESSAGE)
         if not self.channel:
             raise RuntimeError("queue is not connected")
 
-        await try_call(self, partial(self.channel.basic_ack, msg.msg_id))
-        LOGGER.debug(f"{log_msgs.ACKED_MESSAGE} ({msg.msg_id!r}).")
+        if self.auto_prefetch:
+            self._record_processed()
+            await self.retune()
+
+        await self._settle(msg, nack=False)
+        LOGGER.debug("%s (%r).", log_msgs.ACKED_MESSAGE, msg.msg_id)
 
     async def reject_message(self, msg: Message) -> None:
         """Reject (nack) a message from the queue.
 
         Note that RabbitMQ acks messages in-order, so nacking message
         3 of 3 in-progress messages will nack them all.
+
+        Nacks are batched (requeuing) the same way as acks, see
+        `ack_message()` -- so a multi-nack never requeues a message that is
+        still being processed.
         """
         LOGGER.debug(log_msgs.NACKING_MESSAGE)
         if not self.channel:
             raise RuntimeError("queue is not connected")
 
-        await try_call(self, partial(self.channel.basic_nack, msg.msg_id))
-        LOGGER.debug(f"{log_msgs.NACKED_MESSAGE} ({msg.msg_id!r}).")
+        await self._settle(msg, nack=True)
+        LOGGER.debug("%s (%r).", log_msgs.NACKED_MESSAGE, msg.msg_id)
+
+    async def drain_and_ack(self) -> None:
+        """Ack every outstanding message on the channel, in a single frame.
+
+        Use this to finalize work before `close()`, which would otherwise
+        requeue anything unacked. Messages prefetched by `get_message()` or
+        `message_generator()`, but not yet returned/yielded, are requeued
+        instead of acked.
+        """
+        LOGGER.debug(log_msgs.ACKING_MESSAGE)
+        if not self.channel:
+            raise RuntimeError("queue is not connected")
+
+        await self._flush(nack=True)  # these must not be acked
+        if self._generator_consuming:
+            # rejects (requeues) every delivery pika holds, but hasn't yielded
+            await try_call(self, self.channel.cancel)
+            self._generator_consuming = False
+        buffered = await self._cancel_consumer() if self.consumer_id else []
+
+        # delivery_tag=0 & multiple=True means "all outstanding"
+        if not buffered:
+            await try_call(self, self.channel.basic_ack, 0, multiple=True)
+        else:
+            # tags are sequential, so everything below the buffer was handed out
+            if min(buffered) > 1:
+                await try_call(
+                    self, self.channel.basic_ack, min(buffered) - 1, multiple=True
+                )
+            await try_call(
+                self, self.channel.basic_nack, 0, multiple=True, requeue=True
+            )
+
+        # everything handed out is settled now
+        self._pending_acks = []
+        self._outstanding.clear()
+        LOGGER.debug("%s (all outstanding).", log_msgs.ACKED_MESSAGE)
 
     async def message_generator(
         self, timeout: int = 60, propagate_error: bool = True
@@ -247,21 +700,40 @@ class RabbitMQSub(RabbitMQ, Sub):
         if not self.channel:
             raise RuntimeError("queue is not connected")
 
+        # don't compete with `get_message()`'s consumer for deliveries
+        if self.consumer_id:
+            await self._stop_consumer()
+
+        # hoist per-message lookups out of the loop
+        to_message = RabbitMQSub._to_message_bytes
+        debug = LOGGER.debug
+        monotonic = time.monotonic
+        msg_get_new = log_msgs.MSGGEN_GET_NEW_MESSAGE
+        msg_yielding = log_msgs.MSGGEN_YIELDING_MESSAGE
+        track = self._ack_batch_size > 1
+        outstanding = self._outstanding  # (`connect()` clears it, in-place)
+
         msg = None
         try:
-            gen = partial(self.channel.consume, self.queue, inactivity_timeout=timeout)
-
-            async for method_frame, _, body in try_yield(self, gen):
+            fetch_start: Optional[float] = monotonic()
+            self._generator_consuming = True
+            async for method_frame, _, body in try_yield(
+                self, self.channel.consume, self.queue, inactivity_timeout=timeout
+            ):
                 # get message
-                msg = RabbitMQSub._to_message(method_frame, body)
-                LOGGER.debug(log_msgs.MSGGEN_GET_NEW_MESSAGE)
+                msg = to_message(method_frame, body)
+                debug(msg_get_new)
                 if not msg:
                     LOGGER.info(log_msgs.MSGGEN_NO_MESSAGE_LOOK_BACK_IN_QUEUE)
                     break
+                if track:
+                    outstanding.add(method_frame.delivery_tag)
+                if self.auto_prefetch:
+                    self._record_delivery(fetch_start)
 
                 # yield message to consumer
                 try:
-                    LOGGER.debug(f"{log_msgs.MSGGEN_YIELDING_MESSAGE} [{msg}]")
+                    debug("%s [%s]", msg_yielding, msg)
                     yield msg
                 # consumer throws Exception...
                 except Exception as e:  # pylint: disable=W0703
@@ -277,6 +749,10 @@ class RabbitMQSub(RabbitMQ, Sub):
                 # consumer requests again, aka next()
                 else:
                     pass
+                if self.auto_prefetch:
+                    # already waiting in pika's consumer queue -> not a round-trip
+                    waiting = self.channel.get_waiting_message_count()
+                    fetch_start = None if waiting else monotonic()
 
         # Garbage Collection (or explicit close(), or break in consumer's loop)
         except GeneratorExit:
@@ -284,8 +760,17 @@ class RabbitMQSub(RabbitMQ, Sub):
             LOGGER.debug(log_msgs.MSGGEN_GENERATOR_EXITED)
 
 
-async def try_call(queue: RabbitMQ, func: Callable[..., Any]) -> Any:
-    """Try to call `func` and return value.
+def _ewma(prev: Optional[float], sample: float) -> float:
+    """Return the exponentially-weighted moving average including `sample`."""
+    if prev is None:
+        return sample
+    return EWMA_ALPHA * sample + (1 - EWMA_ALPHA) * prev
+
+
+async def try_call(
+    queue: RabbitMQ, func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Try to call `func(*args, **kwargs)` and return value.
 
     Try up to `TRY_ATTEMPTS` times, for connection-related errors.
     """
@@ -296,7 +781,7 @@ async def try_call(queue: RabbitMQ, func: Callable[..., Any]) -> Any:
             )
 
         try:
-            return func()
+            return func(*args, **kwargs)
         except pika.exceptions.ConnectionClosedByBroker:
             LOGGER.debug(log_msgs.TRYCALL_CONNECTION_CLOSED_BY_BROKER)
         # Do not recover on channel errors
@@ -307,8 +792,9 @@ async def try_call(queue: RabbitMQ, func: Callable[..., Any]) -> Any:
         except pika.exceptions.AMQPConnectionError:
             LOGGER.debug(log_msgs.TRYCALL_AMQP_CONNECTION_ERROR)
 
-        await queue.close()
-        time.sleep(RETRY_DELAY)
+        # not `queue.close()`, which may just drop a reference to a shared pub
+        await RabbitMQ.close(queue)
+        await asyncio.sleep(RETRY_DELAY)
         await queue.connect()
 
     LOGGER.debug(log_msgs.TRYCALL_CONNECTION_ERROR_MAX_RETRIES)
@@ -316,9 +802,9 @@ async def try_call(queue: RabbitMQ, func: Callable[..., Any]) -> Any:
 
 
 async def try_yield(
-    queue: RabbitMQ, func: Callable[..., Any]
+    queue: RabbitMQ, func: Callable[..., Any], *args: Any, **kwargs: Any
 ) -> AsyncGenerator[Any, None]:
-    """Try to call `func` and yield value(s).
+    """Try to call `func(*args, **kwargs)` and yield value(s).
 
     Try up to `TRY_ATTEMPTS` times, for connection-related errors.
     """
@@ -329,7 +815,7 @@ async def try_yield(
             )
 
         try:
-            for x in func():  # pylint: disable=invalid-name
+            for x in func(*args, **kwargs):  # pylint: disable=invalid-name
                 yield x
         except pika.exceptions.ConnectionClosedByBroker:
             LOGGER.debug(log_msgs.TRYYIELD_CONNECTION_CLOSED_BY_BROKER)
@@ -341,8 +827,9 @@ async def try_yield(
         except pika.exceptions.AMQPConnectionError:
             LOGGER.debug(log_msgs.TRYYIELD_AMQP_CONNECTION_ERROR)
 
-        await queue.close()
-        time.sleep(RETRY_DELAY)
+        # not `queue.close()`, which may just drop a reference to a shared pub
+        await RabbitMQ.close(queue)
+        await asyncio.sleep(RETRY_DELAY)
         await queue.connect()
 
     LOGGER.debug(log_msgs.TRYYIELD_CONNECTION_ERROR_MAX_RETRIES)
@@ -362,6 +849,10 @@ class Backend(backend_interface.Backend):
     ) -> RabbitMQPub:
         """Create a publishing queue.
 
+        A live pub for the same `address` & `name` (created in the same
+        thread) is shared instead of opening another connection; it's closed
+        once all its callers have called `close()`.
+
         # NOTE - `auth_token` is not used currently
 
         Args:
@@ -371,13 +862,32 @@ class Backend(backend_interface.Backend):
         Returns:
             RawQueue: queue
         """
+        key = (_amqp_address(address), name, threading.get_ident())
+
+        pooled = _PUB_POOL.get(key)
+        if pooled and pooled.connection and pooled.connection.is_open:
+            pooled._refs += 1  # pylint: disable=protected-access
+            return pooled
+
         q = RabbitMQPub(address, name)  # pylint: disable=invalid-name
         await q.connect()
+        # another caller may have pooled one while we were connecting
+        pooled = _PUB_POOL.get(key)
+        if pooled and pooled.connection and pooled.connection.is_open:
+            await q.close()
+            pooled._refs += 1  # pylint: disable=protected-access
+            return pooled
+
+        _PUB_POOL[key] = q
         return q
 
     @staticmethod
     async def create_sub_queue(
-        address: str, name: str, prefetch: int = 1, auth_token: str = ""
+        address: str,
+        name: str,
+        prefetch: int = 1,
+        auth_token: str = "",
+        ack_batch_size: int = 1,
     ) -> RabbitMQSub:
         """Create a subscription queue.
 
@@ -386,11 +896,21 @@ class Backend(backend_interface.Backend):
         Args:
             address (str): address of queue
             name (str): name of queue on address
+            prefetch (int): size of prefetch buffer
+                            (0 means auto-tune, see `RabbitMQSub.retune()`)
+            ack_batch_size (int): max number of acks (or nacks) to send as
+                                  one multi-ack/nack (capped by `prefetch`)
 
         Returns:
             RawQueue: queue
         """
-        q = RabbitMQSub(address, name)  # pylint: disable=invalid-name
-        q.prefetch = prefetch
+        q = RabbitMQSub(  # pylint: disable=invalid-name
+            address, name, ack_batch_size=ack_batch_size
+        )
+        if prefetch == 0:  # AMQP treats 0 as unlimited, so start small & tune
+            q.auto_prefetch = True
+            q.prefetch = 1
+        else:
+            q.prefetch = prefetch
         await q.connect()
         return q
@@ -1,13 +1,28 @@
 """Unit Tests for RabbitMQ/Pika Backend."""
 
+import asyncio
+import itertools
+import threading
+import time
 import unittest
-from typing import Any, List
-from unittest.mock import MagicMock
+from collections import namedtuple
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
+import pika  # type: ignore
 import pytest
 from mqclient.abstract_backend_tests.unit_tests import BackendUnitTest
 from mqclient.backend_interface import Message
-from mqclient_rabbitmq.rabbitmq import Backend
+from mqclient.queue import Queue
+from mqclient_rabbitmq import rabbitmq
+from mqclient_rabbitmq.rabbitmq import Backend, RabbitMQ
+
+# stand-in for pika's method frame (only `delivery_tag` is read)
+Delivery = namedtuple("Delivery", ["delivery_tag"])
+
+# serialized once (deterministic: pickled dict), shared by tests
+FOO_BAR_PAYLOAD = Message.serialize("foo, bar")
+# a delivery that makes pika-side code fail (`ANY` has no `delivery_tag`)
+UPSTREAM_ERR_MSG = (unittest.mock.ANY, None, b"foo, bar")
 
 
 class TestUnitRabbitMQ(BackendUnitTest):
@@ -16,15 +31,39 @@ class TestUnitRabbitMQ(BackendUnitTest):
     backend = Backend()
     con_patch = "pika.BlockingConnection"
 
+    @pytest.fixture
+    def mock_con(self, mocker: Any) -> Any:
+        """Patch mock_con, with an open connection."""
+        patched = mocker.patch(self.con_patch)
+        patched.return_value.is_closed = False  # (otherwise, a truthy MagicMock)
+        return patched
+
+    @staticmethod
+    @pytest.fixture(scope="session")
+    def queue_name() -> str:
+        """Get a queue name, once per session (every broker call is mocked)."""
+        return Queue.make_name()
+
+    @pytest.fixture(autouse=True)
+    def clear_shared_connections(self) -> None:
+        """Don't share connections/pubs across tests (each has its own mock)."""
+        rabbitmq._CONNECTIONS.clear()  # pylint: disable=protected-access
+        rabbitmq._PUB_POOL.clear()  # pylint: disable=protected-access
+
+    @staticmethod
+    def _get_channel_mock(mock_con: Any) -> Any:
+        """Return mock channel (every channel is the same mock)."""
+        return mock_con.return_value.channel.return_value
+
     @staticmethod
     def _get_nack_mock_fn(mock_con: Any) -> Any:
         """Return mock 'nack' function call."""
-        return mock_con.return_value.channel.return_value.basic_nack
+        return TestUnitRabbitMQ._get_channel_mock(mock_con).basic_nack
 
     @staticmethod
     def _get_ack_mock_fn(mock_con: Any) -> Any:
         """Return mock 'ack' function call."""
-        return mock_con.return_value.channel.return_value.basic_ack
+        return TestUnitRabbitMQ._get_channel_mock(mock_con).basic_ack
 
     @staticmethod
     def _get_close_mock_fn(mock_con: Any) -> Any:
@@ -38,10 +77,49 @@ class TestUnitRabbitMQ(BackendUnitTest):
         """Place messages on the mock queue."""
         if len(data) != len(ids):
             raise AttributeError("`data` and `ids` must have the same length.")
-        messages = [(MagicMock(delivery_tag=i), None, d) for d, i in zip(data, ids)]
-        if append_none:
-            messages += [(None, None, None)]  # type: ignore
-        mock_con.return_value.channel.return_value.consume.return_value = messages
+
+        def messages() -> Iterator[Tuple[Any, None, Optional[bytes]]]:
+            for d, i in zip(data, ids):
+                yield Delivery(delivery_tag=i), None, d
+            if append_none:
+                yield None, None, None
+
+        TestUnitRabbitMQ._get_channel_mock(mock_con).consume.return_value = messages()
+
+    @staticmethod
+    def _push_mock_messages(
+        mock_con: Any,
+        polls: Iterable[List[int]],
+        body: Optional[bytes] = None,
+        rtt: float = 0,
+    ) -> None:
+        """Push messages to `get_message()`'s consumer, a list of tags per poll.
+
+        Each poll first takes `rtt` seconds. Bodies are `body`, or `baz-<tag>`.
+        """
+        channel = TestUnitRabbitMQ._get_channel_mock(mock_con)
+        remaining = iter(polls)
+
+        def deliver(*args: Any, **kwargs: Any) -> None:
+            time.sleep(rtt)
+            on_msg = channel.basic_consume.call_args.kwargs["on_message_callback"]
+            for tag in next(remaining, []):
+                data = f"baz-{tag}".encode() if body is None else body
+                on_msg(channel, Delivery(delivery_tag=tag), None, data)
+
+        mock_con.return_value.process_data_events.side_effect = deliver
+
+    @pytest.mark.parametrize(
+        "address,expected",
+        [
+            ("localhost", "amqp://localhost"),
+            ("amqp://localhost", "amqp://localhost"),
+            ("amqps://localhost", "amqps://localhost"),
+        ],
+    )
+    def test_address_prefix(self, address: str, expected: str) -> None:
+        """Test that the AMQP scheme is only prefixed when missing."""
+        assert RabbitMQ(address, "name").address == expected
 
     @pytest.mark.asyncio
     async def test_create_pub_queue(self, mock_con: Any, queue_name: str) -> None:
@@ -50,6 +128,26 @@ class TestUnitRabbitMQ(BackendUnitTest):
         assert pub.queue == queue_name
         mock_con.return_value.channel.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_create_pub_queue_shared(
+        self, mock_con: Any, queue_name: str
+    ) -> None:
+        """Test that identical pub queues share one live connection."""
+        pub_a = await self.backend.create_pub_queue("localhost", queue_name)
+        pub_b = await self.backend.create_pub_queue("amqp://localhost", queue_name)
+        assert pub_a is pub_b
+        mock_con.assert_called_once()
+
+        await pub_a.close()
+        self._get_close_mock_fn(mock_con).assert_not_called()
+        await pub_b.close()
+        self._get_close_mock_fn(mock_con).assert_called_once()
+
+        # closed -> no longer shared
+        pub_c = await self.backend.create_pub_queue("localhost", queue_name)
+        assert pub_c is not pub_a
+        assert mock_con.call_count == 2
+
     @pytest.mark.asyncio
     async def test_create_sub_queue(self, mock_con: Any, queue_name: str) -> None:
         """Test creating sub queue."""
@@ -58,27 +156,116 @@ class TestUnitRabbitMQ(BackendUnitTest):
         assert sub.prefetch == 213
         mock_con.return_value.channel.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_shared_connection(self, mock_con: Any, queue_name: str) -> None:
+        """Test that same-role queues share a connection, each with a channel."""
+        sub_a = await self.backend.create_sub_queue("localhost", queue_name)
+        sub_b = await self.backend.create_sub_queue("localhost", queue_name + "-b")
+        mock_con.assert_called_once()
+        assert mock_con.return_value.channel.call_count == 2
+        # pubs don't ride on subs' connections
+        await self.backend.create_pub_queue("localhost", queue_name)
+        assert mock_con.call_count == 2
+
+        await sub_a.close()
+        self._get_channel_mock(mock_con).close.assert_called_once()
+        self._get_close_mock_fn(mock_con).assert_not_called()
+        await sub_b.close()
+        self._get_close_mock_fn(mock_con).assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("create", ["create_pub_queue", "create_sub_queue"])
+    async def test_shared_connection_per_thread(
+        self, mock_con: Any, queue_name: str, create: str
+    ) -> None:
+        """Test that queues (& pooled pubs) in different threads share nothing."""
+        queues = [await getattr(self.backend, create)("localhost", queue_name)]
+
+        def create_in_thread() -> None:
+            loop = asyncio.new_event_loop()
+            try:
+                queues.append(
+                    loop.run_until_complete(
+                        getattr(self.backend, create)("localhost", queue_name)
+                    )
+                )
+            finally:
+                loop.close()
+
+        thread = threading.Thread(target=create_in_thread)
+        thread.start()
+        thread.join()
+        assert len(queues) == 2 and queues[0] is not queues[1]
+        assert mock_con.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_declare_queue_once_per_connection(
+        self, mock_con: Any, queue_name: str
+    ) -> None:
+        """Test that a queue is only declared once per (shared) connection."""
+        # same role -> same connection (see `test_shared_connection()`)
+        await self.backend.create_sub_queue("localhost", queue_name)
+        await self.backend.create_sub_queue("localhost", queue_name)
+        mock_con.assert_called_once()
+        channel = self._get_channel_mock(mock_con)
+        channel.queue_declare.assert_called_once_with(queue=queue_name, durable=False)
+
     @pytest.mark.asyncio
     async def test_send_message(self, mock_con: Any, queue_name: str) -> None:
         """Test sending message."""
         pub = await self.backend.create_pub_queue("localhost", queue_name)
         await pub.send_message(b"foo, bar, baz")
-        mock_con.return_value.channel.return_value.basic_publish.assert_called_with(
+        self._get_channel_mock(mock_con).basic_publish.assert_called_with(
             exchange="", routing_key=queue_name, body=b"foo, bar, baz"
         )
 
+    @pytest.mark.asyncio
+    async def test_send_message_batch(self, mock_con: Any, queue_name: str) -> None:
+        """Test sending several messages with one transaction commit."""
+        pub = await self.backend.create_pub_queue("localhost", queue_name)
+        await pub.send_message_batch([b"foo", b"bar", b"baz"])
+        channel = self._get_channel_mock(mock_con)
+        assert channel.basic_publish.call_args_list == [
+            unittest.mock.call(exchange="", routing_key=queue_name, body=b)
+            for b in [b"foo", b"bar", b"baz"]
+        ]
+        channel.tx_select.assert_called_once()
+        channel.tx_commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_send_message_retry_closes_tx_channel(
+        self, mocker: Any, mock_con: Any, queue_name: str
+    ) -> None:
+        """Test that a retry on a shared connection doesn't leak channels."""
+        mocker.patch.object(rabbitmq, "RETRY_DELAY", 0)
+        pub = await self.backend.create_pub_queue("localhost", queue_name)
+        await self.backend.create_pub_queue("localhost", queue_name + "-b")
+        await pub.send_message_batch([b"foo"])  # opens the transactional channel
+        channel = self._get_channel_mock(mock_con)
+
+        channel.basic_publish.side_effect = [
+            pika.exceptions.AMQPConnectionError(),
+            None,
+        ]
+        await pub.send_message(b"bar")
+        # both of the pub's channels, but not the other pub's connection
+        assert channel.close.call_count == 2
+        self._get_close_mock_fn(mock_con).assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_message(self, mock_con: Any, queue_name: str) -> None:
         """Test getting message."""
         sub = await self.backend.create_sub_queue("localhost", queue_name)
-        mock_con.return_value.is_closed = False  # HACK - manually set attr
+        channel = self._get_channel_mock(mock_con)
 
-        fake_message = (MagicMock(delivery_tag=12), None, Message.serialize("foo, bar"))
-        mock_con.return_value.channel.return_value.basic_get.return_value = fake_message
+        self._push_mock_messages(mock_con, [[12]], FOO_BAR_PAYLOAD)
         m = await sub.get_message()
         assert m is not None
         assert m.msg_id == 12
         assert m.data == "foo, bar"
+        channel.basic_consume.assert_called_once()
+        # never blocks on the socket
+        mock_con.return_value.process_data_events.assert_called_with(time_limit=0)
 
     @pytest.mark.asyncio
     async def test_message_generator_10_upstream_error(
@@ -90,19 +277,359 @@ class TestUnitRabbitMQ(BackendUnitTest):
         from pika-package code).
         """
         sub = await self.backend.create_sub_queue("localhost", queue_name)
-        mock_con.return_value.is_closed = False  # HACK - manually set attr
-
-        err_msg = (unittest.mock.ANY, None, b"foo, bar")
-        mock_con.return_value.channel.return_value.consume.return_value = [err_msg]
+        self._get_channel_mock(mock_con).consume.return_value = [UPSTREAM_ERR_MSG]
         with pytest.raises(Exception):
             _ = [m async for m in sub.message_generator()]
         # would be called by Queue
         self._get_close_mock_fn(mock_con).assert_not_called()
 
         # `propagate_error` attribute has no affect (b/c it deals w/ *downstream* errors)
-        err_msg = (unittest.mock.ANY, None, b"foo, bar")
-        mock_con.return_value.channel.return_value.consume.return_value = [err_msg]
+        self._get_channel_mock(mock_con).consume.return_value = [UPSTREAM_ERR_MSG]
         with pytest.raises(Exception):
             _ = [m async for m in sub.message_generator(propagate_error=False)]
         # would be called by Queue
         self._get_close_mock_fn(mock_con).assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ack_message_batched(self, mock_con: Any, queue_name: str) -> None:
+        """Test acking contiguous messages with a single multi-ack."""
+        sub = await self.backend.create_sub_queue(
+            "localhost", queue_name, prefetch=4, ack_batch_size=4
+        )
+        ack_mock = self._get_ack_mock_fn(mock_con)
+
+        for tag in [1, 2, 3]:
+            await sub.ack_message(Message(tag, b""))
+        ack_mock.assert_not_called()
+        await sub.ack_message(Message(4, b""))
+        ack_mock.assert_called_once_with(4, multiple=True)
+
+        # a gap in the tags flushes the batch (nothing is held, so 7 starts one)
+        await sub.ack_message(Message(5, b""))
+        await sub.ack_message(Message(7, b""))
+        assert ack_mock.call_args_list[1:] == [unittest.mock.call(5)]
+
+        # pending acks are flushed on close
+        await sub.ack_message(Message(8, b""))
+        await sub.close()
+        ack_mock.assert_called_with(8, multiple=True)
+
+    @pytest.mark.asyncio
+    async def test_ack_message_out_of_order(
+        self, mock_con: Any, queue_name: str
+    ) -> None:
+        """Test that a multi-ack never covers a message still being processed."""
+        sub = await self.backend.create_sub_queue(
+            "localhost", queue_name, prefetch=8, ack_batch_size=4
+        )
+        ack_mock = self._get_ack_mock_fn(mock_con)
+        nack_mock = self._get_nack_mock_fn(mock_con)
+
+        self._push_mock_messages(mock_con, [list(range(1, 12))])
+        msgs = {}
+        for _ in range(7):
+            m = await sub.get_message()
+            assert m
+            msgs[m.msg_id] = m
+
+        # tag 2 is still held, so nothing above it can be batched
+        for tag in [1, 3, 4, 5, 6, 7]:
+            await sub.ack_message(msgs[tag])
+        assert ack_mock.call_args_list == [
+            unittest.mock.call(t) for t in [1, 3, 4, 5, 6, 7]
+        ]
+
+        # settling tag 2 closes the gap, so batching resumes after tag 7
+        await sub.reject_message(msgs[2])
+        for _ in range(4):
+            m = await sub.get_message()
+            assert m
+            await sub.ack_message(m)
+        nack_mock.assert_called_once_with(2)
+        ack_mock.assert_called_with(11, multiple=True)
+        assert ack_mock.call_count == 7
+
+    @pytest.mark.asyncio
+    async def test_get_message_buffered(self, mock_con: Any, queue_name: str) -> None:
+        """Test getting messages from the prefetch buffer & requeuing on close."""
+        sub = await self.backend.create_sub_queue("localhost", queue_name, prefetch=3)
+        channel = self._get_channel_mock(mock_con)
+        channel.basic_consume.return_value = "consumer-tag"
+
+        self._push_mock_messages(mock_con, [[1, 2, 3]])
+        m = await sub.get_message()
+        assert m and m.msg_id == 1
+        m = await sub.get_message()
+        assert m and m.msg_id == 2
+        # one wait for all the pushed messages
+        mock_con.return_value.process_data_events.assert_called_once()
+
+        await sub.close()
+        channel.basic_cancel.assert_called_once_with("consumer-tag")
+        # 1 & 2 are still held, so only 3 is requeued
+        channel.basic_nack.assert_called_once_with(3, requeue=True)
+
+    @pytest.mark.asyncio
+    async def test_message_generator_after_get_message(
+        self, mock_con: Any, queue_name: str
+    ) -> None:
+        """Test that switching to `message_generator()` only requeues the buffer."""
+        sub = await self.backend.create_sub_queue("localhost", queue_name, prefetch=4)
+        channel = self._get_channel_mock(mock_con)
+        channel.basic_consume.return_value = "consumer-tag"
+
+        self._push_mock_messages(mock_con, [[1, 2, 3, 4]])
+        held = await sub.get_message()
+        assert held and held.msg_id == 1
+
+        # tag 1 is held by the caller, so the buffer is requeued one-by-one
+        await self._enqueue_mock_messages(mock_con, [], [])
+        _ = [m async for m in sub.message_generator()]
+        channel.basic_cancel.assert_called_once_with("consumer-tag")
+        assert channel.basic_nack.call_args_list == [
+            unittest.mock.call(t, requeue=True) for t in [2, 3, 4]
+        ]
+        await sub.ack_message(held)
+        channel.basic_ack.assert_called_once_with(1)
+
+        # nothing held (on a new channel) -> requeued with a single multi-nack
+        channel.basic_nack.reset_mock()
+        sub = await self.backend.create_sub_queue(
+            "localhost", queue_name, prefetch=4, ack_batch_size=2
+        )
+        self._push_mock_messages(mock_con, [[1, 2, 3, 4]])
+        for _ in range(2):
+            m = await sub.get_message()
+            assert m
+            await sub.ack_message(m)
+        await self._enqueue_mock_messages(mock_con, [], [])
+        _ = [m async for m in sub.message_generator()]
+        channel.basic_nack.assert_called_once_with(4, multiple=True, requeue=True)
+
+    @pytest.mark.asyncio
+    async def test_ack_message_batched_across_unseen_tags(
+        self, mock_con: Any, queue_name: str
+    ) -> None:
+        """Test batching after tags that were never handed out.
+
+        E.g., pika's `basic_cancel()` requeues deliveries it hadn't dispatched.
+        """
+        sub = await self.backend.create_sub_queue(
+            "localhost", queue_name, prefetch=4, ack_batch_size=2
+        )
+        ack_mock = self._get_ack_mock_fn(mock_con)
+
+        # tags 3 & 4 never reach the buffer
+        self._push_mock_messages(mock_con, [[1, 2]])
+        for _ in range(2):
+            m = await sub.get_message()
+            assert m
+            await sub.ack_message(m)
+
+        await self._enqueue_mock_messages(mock_con, [b"foo"] * 4, [5, 6, 7, 8])
+        async for m in sub.message_generator():
+            assert m
+            await sub.ack_message(m)
+        assert ack_mock.call_args_list == [
+            unittest.mock.call(t, multiple=True) for t in [2, 6, 8]
+        ]
+        assert not sub._outstanding  # pylint: disable=protected-access
+
+    @pytest.mark.asyncio
+    async def test_create_sub_queue_auto_prefetch(
+        self, mock_con: Any, queue_name: str
+    ) -> None:
+        """Test creating sub queue with auto-tuned prefetch & re-tuning it."""
+        sub = await self.backend.create_sub_queue("localhost", queue_name, prefetch=0)
+        assert sub.auto_prefetch
+        assert sub.prefetch == 1
+        qos_mock = self._get_channel_mock(mock_con).basic_qos
+        qos_mock.assert_called_with(prefetch_count=1, global_qos=True)
+
+        # within 2x -> no change
+        sub._rtt_ewma, sub._proc_ewma = 0.2, 0.1  # pylint: disable=protected-access
+        await sub.retune()
+        assert sub.prefetch == 1
+
+        sub._rtt_ewma, sub._proc_ewma = 1.0, 0.1  # pylint: disable=protected-access
+        await sub.retune()
+        assert sub.prefetch == 10
+        qos_mock.assert_called_with(prefetch_count=10, global_qos=True)
+
+        sub._rtt_ewma, sub._proc_ewma = 1e6, 1.0  # pylint: disable=protected-access
+        await sub.retune()
+        assert sub.prefetch == sub.max_prefetch
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "prefetch,per_poll", [(0, 1), (64, 64)], ids=["grow", "buffered"]
+    )
+    async def test_auto_prefetch_timing(
+        self, mock_con: Any, queue_name: str, prefetch: int, per_poll: int
+    ) -> None:
+        """Test re-tuning from real `get_message()`/`ack_message()` timing.
+
+        Each wait on the broker takes ~RTT, and each message ~1ms to process.
+        """
+        rtt = 0.1
+        sub = await self.backend.create_sub_queue("localhost", queue_name, prefetch)
+        sub.auto_prefetch = True
+        self._push_mock_messages(
+            mock_con,
+            (list(range(i, i + per_poll)) for i in itertools.count(1, per_poll)),
+            rtt=rtt,
+        )
+        for _ in range(40 if per_poll > 1 else 3):
+            msg = await sub.get_message()
+            assert msg
+            await asyncio.sleep(0.001)
+            await sub.ack_message(msg)
+
+        if per_poll == 1:  # every message is a round-trip away -> grow
+            assert sub.prefetch > 2
+        else:  # served from the local buffer -> no RTT samples -> no shrinking
+            assert sub.prefetch >= 32
+            mock_con.return_value.process_data_events.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_message_timeout(self, mock_con: Any, queue_name: str) -> None:
+        """Test getting no message, while still yielding to the event loop."""
+        sub = await self.backend.create_sub_queue("localhost", queue_name)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(ticker())
+        assert await sub.get_message(timeout_millis=50) is None
+        task.cancel()
+        assert ticks > 1
+        assert mock_con.return_value.process_data_events.call_count > 1
+
+    @pytest.mark.asyncio
+    async def test_get_message_poll_backoff(
+        self, mock_con: Any, queue_name: str
+    ) -> None:
+        """Test that a delivery arriving right after the first poll isn't delayed."""
+        sub = await self.backend.create_sub_queue("localhost", queue_name)
+
+        self._push_mock_messages(mock_con, [[], [1]], FOO_BAR_PAYLOAD)
+        start = time.monotonic()
+        assert await sub.get_message()
+        assert mock_con.return_value.process_data_events.call_count == 2
+        # the first back-off is `sleep(0)`, not a full poll interval
+        assert time.monotonic() - start < rabbitmq.GETMSG_POLL_INTERVAL
+
+    @pytest.mark.asyncio
+    async def test_drain_and_ack(self, mock_con: Any, queue_name: str) -> None:
+        """Test acking all outstanding messages with one frame."""
+        sub = await self.backend.create_sub_queue(
+            "localhost", queue_name, prefetch=4, ack_batch_size=4
+        )
+        channel = self._get_channel_mock(mock_con)
+
+        await sub.ack_message(Message(1, b""))  # batched
+        await sub.drain_and_ack()
+        channel.basic_ack.assert_called_once_with(0, multiple=True)
+        channel.basic_nack.assert_not_called()
+
+        # buffered (never returned) messages are requeued, not acked
+        channel.basic_ack.reset_mock()
+
+        self._push_mock_messages(mock_con, [[1, 2, 3]])
+        m = await sub.get_message()
+        assert m and m.msg_id == 1
+        await sub.drain_and_ack()
+        channel.basic_cancel.assert_called_once()
+        channel.basic_ack.assert_called_once_with(1, multiple=True)
+        channel.basic_nack.assert_called_once_with(0, multiple=True, requeue=True)
+        channel.cancel.assert_not_called()  # `message_generator()` never ran
+
+    @pytest.mark.asyncio
+    async def test_drain_and_ack_message_generator(
+        self, mock_con: Any, queue_name: str
+    ) -> None:
+        """Test that deliveries `message_generator()` hasn't yielded are requeued."""
+        sub = await self.backend.create_sub_queue(
+            "localhost", queue_name, prefetch=4, ack_batch_size=4
+        )
+        channel = self._get_channel_mock(mock_con)
+
+        await self._enqueue_mock_messages(mock_con, [b"foo"] * 3, [1, 2, 3])
+        async for m in sub.message_generator():
+            assert m and m.msg_id == 1
+            break  # 2 & 3 are still held by pika's consumer
+        await sub.drain_and_ack()
+
+        # pika's `cancel()` rejects those, and only then is everything acked
+        assert channel.method_calls[-2:] == [
+            unittest.mock.call.cancel(),
+            unittest.mock.call.basic_ack(0, multiple=True),
+        ]
+        assert not sub._outstanding  # pylint: disable=protected-access
+
+        # ...only once
+        await sub.drain_and_ack()
+        channel.cancel.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reject_message_batched(self, mock_con: Any, queue_name: str) -> None:
+        """Test rejecting contiguous messages with a single multi-nack."""
+        sub = await self.backend.create_sub_queue(
+            "localhost", queue_name, prefetch=3, ack_batch_size=3
+        )
+        ack_mock = self._get_ack_mock_fn(mock_con)
+        nack_mock = self._get_nack_mock_fn(mock_con)
+
+        for tag in [1, 2, 3]:
+            await sub.reject_message(Message(tag, b""))
+        nack_mock.assert_called_once_with(3, multiple=True, requeue=True)
+
+        # an ack flushes pending nacks first (& vice versa)
+        await sub.reject_message(Message(4, b""))
+        await sub.ack_message(Message(5, b""))
+        nack_mock.assert_called_with(4)
+        ack_mock.assert_not_called()
+        await sub.reject_message(Message(6, b""))
+        ack_mock.assert_called_once_with(5)
+
+        await sub.close()
+        nack_mock.assert_called_with(6)
+
+    @pytest.mark.asyncio
+    async def test_reject_message_out_of_order(
+        self, mock_con: Any, queue_name: str
+    ) -> None:
+        """Test that a multi-nack never requeues a message still being processed."""
+        sub = await self.backend.create_sub_queue(
+            "localhost", queue_name, prefetch=8, ack_batch_size=4
+        )
+        ack_mock = self._get_ack_mock_fn(mock_con)
+        nack_mock = self._get_nack_mock_fn(mock_con)
+
+        self._push_mock_messages(mock_con, [list(range(1, 12))])
+        msgs = {}
+        for _ in range(7):
+            m = await sub.get_message()
+            assert m
+            msgs[m.msg_id] = m
+
+        # tag 2 is still held, so nothing above it can be batched
+        for tag in [1, 3, 4, 5, 6, 7]:
+            await sub.reject_message(msgs[tag])
+        assert nack_mock.call_args_list == [
+            unittest.mock.call(t) for t in [1, 3, 4, 5, 6, 7]
+        ]
+
+        # settling tag 2 closes the gap, so batching resumes after tag 7
+        await sub.ack_message(msgs[2])
+        for _ in range(4):
+            m = await sub.get_message()
+            assert m
+            await sub.reject_message(m)
+        ack_mock.assert_called_once_with(2)
+        nack_mock.assert_called_with(11, multiple=True, requeue=True)
+        assert nack_mock.call_count == 7